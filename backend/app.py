@@ -26,9 +26,6 @@ quests_collection = db.quests
 app.config["JWT_SECRET_KEY"] = os.getenv("JWT_SECRET_KEY") 
 jwt = JWTManager(app)
 GEMINI_KEY = os.getenv('GEMINI_API_KEY')
-rf = joblib.load("rf_model.pkl")
-gb = joblib.load("gb_model.pkl")
-meta_model = joblib.load("meta_model.pkl")
 client = genai.Client(api_key=GEMINI_KEY)
 
 from routes.auth_routes import auth_bp
@@ -37,6 +34,10 @@ from routes.playbook_route import playbook_bp
 from routes.quest_route import quest_bp
 from routes.tracker_route import tracker_bp
 from routes.update_route import update_bp
+from routes.model_route import model_bp
+from services.single_flight import single_flight
+from services.model_registry import model_registry
+from services.admission import admission
 
 app.register_blueprint(auth_bp)
 app.register_blueprint(credit_bp)
@@ -44,6 +45,8 @@ app.register_blueprint(playbook_bp)
 app.register_blueprint(quest_bp)
 app.register_blueprint(tracker_bp)
 app.register_blueprint(update_bp)
+app.register_blueprint(model_bp)
+admission.init_app(app)
 
 @app.route('/home', methods=['POST'])
 def home():
@@ -60,6 +63,14 @@ def home():
 
     return jsonify(user), 200
 
+@app.route('/metrics', methods=['GET'])
+def metrics():
+    return jsonify({
+        "single_flight": single_flight.stats(),
+        "credit_batching": model_registry.current.scorer.stats(),
+        "admission": admission.stats()
+    }), 200
+
 
 
 
@@ -0,0 +1,133 @@
+"""Load test: tail latency of a cheap route while an expensive one is overloaded.
+
+Models a server with a fixed pool of worker threads (like gunicorn sync
+workers) and drives it open-loop with more expensive requests than it can
+serve, mixed with cheap reads. A second case fires bursts of concurrent
+/credit-score requests at a real BatchScorer (stand-in models) behind the
+default limits, to check admission does not cap how large a batch can get.
+Run from the backend directory:
+
+    python -m benchmarks.admission_load_test
+"""
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+from flask import Blueprint, Flask, jsonify
+
+from benchmarks.batch_scoring_load_test import COLUMNS, train_models
+from services.admission import AdmissionController
+from services.batch_scorer import CREDIT_BATCH_MAX_SIZE, BatchScorer
+
+WORKERS = 8
+HEAVY_SECONDS = 0.1
+HEAVY_RPS = 200
+LIGHT_RPS = 50
+DURATION = 3.0
+LIMITS = {"heavy": {"concurrency": 5, "queue": 1, "timeout": 0.2}}
+CREDIT_BURSTS = 4
+
+
+def make_app(limited):
+    app = Flask(__name__)
+
+    @app.route("/expensive", methods=["POST"])
+    def expensive():
+        time.sleep(HEAVY_SECONDS)
+        return jsonify({"ok": True})
+
+    @app.route("/home", methods=["POST"])
+    def home():
+        return jsonify({"ok": True})
+
+    if limited:
+        AdmissionController(LIMITS, {"expensive": ["heavy"]}).init_app(app)
+    return app
+
+
+def drive(app):
+    client = app.test_client()
+    results = {"/home": [], "/expensive": []}
+    statuses = {}
+
+    def call(path, submitted):
+        response = client.post(path)
+        results[path].append(time.perf_counter() - submitted)
+        statuses[(path, response.status_code)] = statuses.get((path, response.status_code), 0) + 1
+
+    schedule = sorted(
+        [(i / HEAVY_RPS, "/expensive") for i in range(int(HEAVY_RPS * DURATION))]
+        + [(i / LIGHT_RPS, "/home") for i in range(int(LIGHT_RPS * DURATION))]
+    )
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=WORKERS) as pool:
+        for offset, path in schedule:
+            delay = start + offset - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            pool.submit(call, path, time.perf_counter())
+    return results, statuses
+
+
+def make_credit_app(scorer, limited):
+    app = Flask(__name__)
+    # Same blueprint and view name as routes/creditscore_route.py, so the
+    # default route table applies.
+    credit_bp = Blueprint("credit", __name__)
+
+    @credit_bp.route("/credit-score", methods=["POST"])
+    def credit_score():
+        row = pd.DataFrame([np.random.default_rng().random(len(COLUMNS)) * 100000], columns=COLUMNS)
+        _, _, score, _ = scorer.score(row)
+        return jsonify({"credit_score": float(score)})
+
+    app.register_blueprint(credit_bp)
+    if limited:
+        AdmissionController().init_app(app)
+    return app
+
+
+def drive_credit(models, limited):
+    scorer = BatchScorer(*models)
+    client = make_credit_app(scorer, limited).test_client()
+    latencies = []
+    statuses = {}
+
+    def call(_):
+        start = time.perf_counter()
+        response = client.post("/credit-score")
+        latencies.append(time.perf_counter() - start)
+        statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+
+    with ThreadPoolExecutor(max_workers=CREDIT_BATCH_MAX_SIZE) as pool:
+        for _ in range(CREDIT_BURSTS):
+            list(pool.map(call, range(CREDIT_BATCH_MAX_SIZE)))
+    stats = scorer.stats()
+    scorer.close()
+    return latencies, statuses, stats
+
+
+def main():
+    print(f"{WORKERS} workers, /expensive {HEAVY_RPS} rps x {HEAVY_SECONDS * 1000:g} ms, /home {LIGHT_RPS} rps, {DURATION:g} s")
+    for limited in (False, True):
+        results, statuses = drive(make_app(limited))
+        home = np.array(results["/home"]) * 1000
+        print(f"\nadmission control {'on' if limited else 'off'}")
+        print(f"  /home p50 {np.percentile(home, 50):8.1f} ms   p99 {np.percentile(home, 99):8.1f} ms")
+        for (path, status), count in sorted(statuses.items()):
+            print(f"  {path:<11} {status}: {count}")
+
+    models = train_models(np.random.default_rng(0))
+    print(f"\n/credit-score: {CREDIT_BURSTS} bursts of {CREDIT_BATCH_MAX_SIZE} concurrent requests, default limits")
+    for limited in (False, True):
+        latencies, statuses, stats = drive_credit(models, limited)
+        print(f"\nadmission control {'on' if limited else 'off'}")
+        print(f"  p50 {np.percentile(latencies, 50) * 1000:8.1f} ms   p99 {np.percentile(latencies, 99) * 1000:8.1f} ms"
+              f"   avg batch size {stats['avg_batch_size']:.1f}")
+        for status, count in sorted(statuses.items()):
+            print(f"  /credit-score {status}: {count}")
+
+
+if __name__ == "__main__":
+    main()
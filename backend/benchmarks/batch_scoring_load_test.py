@@ -0,0 +1,71 @@
+"""Load test: per-request scoring vs micro-batched scoring at high concurrency.
+
+Trains small stand-in models on synthetic features, so no .pkl files are
+needed. Run from the backend directory:
+
+    python -m benchmarks.batch_scoring_load_test
+"""
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import GradientBoostingRegressor, RandomForestRegressor
+from sklearn.linear_model import LinearRegression
+
+from services.batch_scorer import BatchScorer
+
+COLUMNS = [
+    "total_savings", "total_expenditure", "savings_rate", "num_savings_accounts", "num_current_accounts",
+    "total_account_balance", "num_investments", "total_investment", "num_loans", "total_loan_amount",
+    "total_loan_emi", "num_assets", "total_asset_value", "salary"
+]
+CONCURRENCY = [1, 8, 32, 64]
+REQUESTS = 512
+
+
+def train_models(rng):
+    X = pd.DataFrame(rng.random((2000, len(COLUMNS))) * 100000, columns=COLUMNS)
+    y = 300 + 550 * rng.random(2000)
+    rf = RandomForestRegressor(n_estimators=50, max_depth=8, random_state=0).fit(X, y)
+    gb = GradientBoostingRegressor(n_estimators=50, max_depth=3, random_state=0).fit(X, y)
+    stack = pd.DataFrame({"rf": rf.predict(X), "gb": gb.predict(X)})
+    meta_model = LinearRegression().fit(stack, y)
+    return rf, gb, meta_model
+
+
+def run(score, rows, concurrency):
+    latencies = []
+
+    def one(row):
+        start = time.perf_counter()
+        score(row)
+        latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(one, rows))
+    elapsed = time.perf_counter() - start
+    return len(rows) / elapsed, np.percentile(latencies, 99) * 1000
+
+
+def main():
+    rng = np.random.default_rng(0)
+    rf, gb, meta_model = train_models(rng)
+    scorer = BatchScorer(rf, gb, meta_model)
+    rows = [pd.DataFrame(rng.random((1, len(COLUMNS))) * 100000, columns=COLUMNS) for _ in range(REQUESTS)]
+
+    def unbatched(row):
+        return scorer.predict_batch(row)
+
+    print(f"batch window: {scorer.max_wait * 1000:g} ms / {scorer.max_batch_size} rows, {REQUESTS} requests")
+    print(f"{'concurrency':>11} {'unbatched rps':>14} {'p99 ms':>8} {'batched rps':>12} {'p99 ms':>8} {'speedup':>8}")
+    for concurrency in CONCURRENCY:
+        base_rps, base_p99 = run(unbatched, rows, concurrency)
+        batched_rps, batched_p99 = run(scorer.score, rows, concurrency)
+        print(f"{concurrency:>11} {base_rps:>14.0f} {base_p99:>8.1f} {batched_rps:>12.0f} {batched_p99:>8.1f} {batched_rps / base_rps:>7.1f}x")
+    print(f"batching stats: {scorer.stats()}")
+
+
+if __name__ == "__main__":
+    main()
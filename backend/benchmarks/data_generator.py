@@ -0,0 +1,119 @@
+"""Synthetic user population for scale tests.
+
+Fills a users collection with N users whose profile sizes follow rough
+real-world shapes: lognormal salaries, Poisson-distributed account, loan,
+investment and asset counts, and tracker/credit-score histories whose
+length centres on ``history_months``.
+
+    python -m benchmarks.data_generator --mongodb-uri mongodb://localhost:27018 --users 1000
+
+wipes and refills the ``fincoach`` database on that server, so point it at
+a throwaway local mongod, never at MONGODB_URI.
+"""
+import argparse
+import os
+from datetime import datetime, timedelta
+
+import bcrypt
+import numpy as np
+
+PASSWORD = "scale-test-password"
+BANKS = ["SBI", "HDFC", "ICICI", "Axis", "Kotak", "PNB", "Bank of Baroda", "Yes Bank"]
+STOCKS = ["RELIANCE", "TCS", "INFY", "HDFCBANK", "ITC", "LT", "SBIN", "NIFTYBEES", "PPF", "NPS"]
+LOAN_TYPES = ["Home", "Car", "Education", "Personal", "Gold"]
+ASSET_TYPES = ["House", "Land", "Gold", "Vehicle", "Jewellery"]
+BADGES = ["Multi-Account Holder", "Investment Starter", "Asset Builder", "Savings Growth", "Credit Score Explorer"]
+
+QUEST_CATALOGUE = [
+    {"id": i, "title": f"Quest {i}", "description": f"Synthetic quest {i}", "icon": "Star",
+     "points": 50 * (1 + i % 4), "max_progress": 1 + i % 5, "category": "savings", "difficulty": "easy"}
+    for i in range(1, 21)
+]
+
+
+def _money(rng, median, sigma=0.8):
+    return round(float(rng.lognormal(np.log(median), sigma)), 2)
+
+
+def generate_user(rng, index, history_months, password_hash):
+    salary = _money(rng, 60000, 0.6)
+    months = max(1, int(rng.poisson(history_months)))
+    savings = [round(salary * float(rng.beta(2, 5)), 2) for _ in range(months)]
+    expenditure = [round(salary * float(rng.beta(5, 3)), 2) for _ in range(months)]
+
+    start = datetime(2020, 1, 1)
+    checks = int(rng.poisson(history_months / 2))
+    credit_scores = [
+        {"score": int(np.clip(rng.normal(710, 60), 300, 900)),
+         "timestamp": (start + timedelta(days=int(d))).isoformat(),
+         "model_version": "synthetic"}
+        for d in sorted(rng.integers(0, 30 * max(months, 1), size=checks))
+    ]
+
+    quest_ids = rng.choice([q["id"] for q in QUEST_CATALOGUE], size=int(rng.integers(0, 8)), replace=False)
+    quest_progress = [
+        {"quest_id": int(q), "progress": int(rng.integers(0, 6)), "completed": bool(rng.random() < 0.3)}
+        for q in quest_ids
+    ]
+    badges = [
+        {"name": name, "description": "", "icon": "Star", "earned_date": start.isoformat()}
+        for name in BADGES if rng.random() < 0.3
+    ]
+
+    return {
+        "email": f"user{index}@scale.test",
+        "password_hash": password_hash,
+        "job": {"company": "Synthetic Pvt Ltd", "designation": "Engineer", "salary": salary},
+        "savings": savings,
+        "expenditure": expenditure,
+        "savings_accounts": [{"bank_name": str(rng.choice(BANKS)), "balance": _money(rng, 80000)}
+                             for _ in range(1 + int(rng.poisson(0.8)))],
+        "current_accounts": [{"bank_name": str(rng.choice(BANKS)), "balance": _money(rng, 40000)}
+                             for _ in range(int(rng.poisson(0.5)))],
+        "investments": [{"stock": str(rng.choice(STOCKS)), "quantity": int(rng.integers(1, 200)), "value": _money(rng, 50000)}
+                        for _ in range(int(rng.poisson(3)))],
+        "loans": [{"type": str(rng.choice(LOAN_TYPES)), "amount": _money(rng, 500000), "emi": _money(rng, 12000)}
+                  for _ in range(int(rng.poisson(0.8)))],
+        "assets": [{"type": str(rng.choice(ASSET_TYPES)), "value": _money(rng, 800000, 1.0)}
+                   for _ in range(int(rng.poisson(1.2)))],
+        "quest_progress": quest_progress,
+        "quests": {"points": int(rng.integers(0, 20)) * 50, "badges": badges},
+        "tracking_count": months,
+        "credit_scores": credit_scores,
+    }
+
+
+def populate(db, users, history_months, seed=0, batch_size=500):
+    """Replace ``db.users``/``db.quests`` with a synthetic population."""
+    rng = np.random.default_rng(seed)
+    # One low-cost hash shared by every user keeps generation fast.
+    password_hash = bcrypt.hashpw(PASSWORD.encode("utf-8"), bcrypt.gensalt(rounds=4)).decode("utf-8")
+    db.users.delete_many({})
+    db.quests.delete_many({})
+    db.quests.insert_many([dict(q) for q in QUEST_CATALOGUE])
+    for start in range(0, users, batch_size):
+        db.users.insert_many([
+            generate_user(rng, i, history_months, password_hash)
+            for i in range(start, min(start + batch_size, users))
+        ])
+    db.users.create_index("email", unique=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--history-months", type=int, default=24)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--mongodb-uri", required=True)
+    args = parser.parse_args()
+    if args.mongodb_uri == os.getenv("MONGODB_URI"):
+        parser.error("refusing to overwrite the database configured in MONGODB_URI")
+
+    from pymongo import MongoClient
+
+    populate(MongoClient(args.mongodb_uri).fincoach, args.users, args.history_months, args.seed)
+    print(f"Inserted {args.users} users with ~{args.history_months} months of history")
+
+
+if __name__ == "__main__":
+    main()
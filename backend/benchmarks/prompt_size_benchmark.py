@@ -0,0 +1,64 @@
+"""Offline benchmark of playbook prompt size across synthetic profiles.
+
+Run from the backend directory:
+
+    python -m benchmarks.prompt_size_benchmark
+"""
+import random
+
+from services.prompt_builder import (
+    PROMPT_FOOTER,
+    PROMPT_HEADER,
+    PROMPT_TOKEN_BUDGET,
+    build_playbook_prompt,
+    estimate_tokens,
+)
+
+HOLDING_COUNTS = [0, 2, 5, 10, 25, 50, 100]
+QUERY = "How can I retire in 15 years?"
+
+
+def synthetic_summary(n, rng):
+    return {
+        "salary": rng.randint(25000, 300000),
+        "savings": rng.randint(0, 2000000),
+        "expenditure": rng.randint(10000, 1500000),
+        "loans": [{"type": rng.choice(["Home", "Car", "Education", "Personal"]),
+                   "amount": rng.randint(50000, 5000000), "emi": rng.randint(2000, 60000)} for _ in range(n)],
+        "assets": [{"type": rng.choice(["Land", "House", "Gold", "Vehicle"]),
+                    "value": rng.randint(10000, 10000000)} for _ in range(n)],
+        "investments": [{"stock": f"STOCK{i}", "quantity": rng.randint(1, 500),
+                         "value": rng.randint(1000, 500000)} for i in range(n)],
+        "savings_accounts": [{"bank_name": f"Bank {i}", "balance": rng.randint(0, 800000)} for i in range(n)],
+        "current_accounts": [{"bank_name": f"Bank {i}", "balance": rng.randint(0, 800000)} for i in range(n)],
+    }
+
+
+def raw_prompt(user_summary):
+    # The pre-compaction prompt: every holding list inlined as its Python repr.
+    lines = [
+        f"- Monthly Salary: ₹{user_summary['salary']}",
+        f"- Total Savings: ₹{user_summary['savings']}",
+        f"- Monthly Expenditure: ₹{user_summary['expenditure']}",
+        f"- Loans: {user_summary['loans']}",
+        f"- Assets: {user_summary['assets']}",
+        f"- Investments: {user_summary['investments']}",
+        f"- Savings Accounts: {user_summary['savings_accounts']}",
+        f"- Current Accounts: {user_summary['current_accounts']}",
+    ]
+    return PROMPT_HEADER + "\n".join(lines) + "\n" + PROMPT_FOOTER.format(user_query=QUERY)
+
+
+def main():
+    rng = random.Random(42)
+    print(f"token budget: {PROMPT_TOKEN_BUDGET}")
+    print(f"{'holdings':>9} {'raw tokens':>11} {'compact':>8} {'saved':>7}")
+    for n in HOLDING_COUNTS:
+        summary = synthetic_summary(n, rng)
+        raw = estimate_tokens(raw_prompt(summary))
+        _, compact = build_playbook_prompt(summary, QUERY)
+        print(f"{n:>9} {raw:>11} {compact:>8} {1 - compact / raw:>7.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""Count DB round trips per dashboard load, per-section polling vs single pass.
+
+Both sides evaluate the same scope, the six QUEST_CONFIG sections, against
+an in-memory collection that applies every write, so a second ("warm")
+load sees the badges the first one awarded. Run from the backend directory:
+
+    python -m benchmarks.quest_round_trips
+"""
+import copy
+from types import SimpleNamespace
+
+from services.quest_engine import QUEST_CONFIG, evaluate_quests
+
+EMAIL = "bench@example.com"
+
+
+def _resolve(doc, path):
+    *parents, leaf = path.split(".")
+    for key in parents:
+        doc = doc[int(key)] if isinstance(doc, list) else doc.setdefault(key, {})
+    return doc, leaf
+
+
+class CountingCollection:
+    def __init__(self, docs):
+        self.docs = docs
+        self.reads = 0
+        self.writes = 0
+
+    def _match(self, query):
+        for doc in self.docs:
+            if doc.get("email") != query.get("email"):
+                continue
+            excluded = query.get("quests.badges.name", {}).get("$nin", [])
+            quests = doc.get("quests")
+            badges = (quests.get("badges") or []) if isinstance(quests, dict) else []
+            if any(b.get("name") in excluded for b in badges):
+                continue
+            return doc
+        return None
+
+    def find_one(self, query, projection=None):
+        self.reads += 1
+        doc = self._match(query)
+        return copy.deepcopy(doc) if doc is not None else None
+
+    def update_one(self, query, update):
+        self.writes += 1
+        doc = self._match(query)
+        if doc is None:
+            return SimpleNamespace(matched_count=0, modified_count=0)
+        for path, value in update.get("$set", {}).items():
+            parent, leaf = _resolve(doc, path)
+            if isinstance(parent, list):
+                parent[int(leaf)] = value
+            else:
+                parent[leaf] = value
+        for path, value in update.get("$push", {}).items():
+            parent, leaf = _resolve(doc, path)
+            parent.setdefault(leaf, []).extend(value["$each"] if isinstance(value, dict) and "$each" in value else [value])
+        for path, value in update.get("$inc", {}).items():
+            parent, leaf = _resolve(doc, path)
+            parent[leaf] = parent.get(leaf, 0) + value
+        return SimpleNamespace(matched_count=1, modified_count=1)
+
+
+def sample_user(earned):
+    return {
+        "email": EMAIL,
+        "savings_accounts": [{"balance": 1}, {"balance": 2}],
+        "current_accounts": [],
+        "investments": [{"value": 1}],
+        "assets": [{"value": 1}],
+        "savings": [100, 200],
+        "credit_scores": [{"score": 700}],
+        "tracking_count": 3,
+        "quests": {"points": 0, "badges": [{"name": QUEST_CONFIG[s]["badge_name"]} for s in earned]},
+    }
+
+
+def polling_load(users):
+    # /update, then the client polls /quests/check/<section> for every section.
+    users.update_one({"email": EMAIL}, {"$set": {"assets": [{"value": 1}]}})
+    users.find_one({"email": EMAIL})
+    for section in QUEST_CONFIG:
+        evaluate_quests(users, EMAIL, sections=[section])
+
+
+def single_pass_load(users):
+    # /update evaluates every section in-process before reading the user back.
+    users.update_one({"email": EMAIL}, {"$set": {"assets": [{"value": 1}]}})
+    evaluate_quests(users, EMAIL)
+    users.find_one({"email": EMAIL})
+
+
+def main():
+    print(f"{'load':<36} {'polling':>10} {'single pass':>12}")
+    for label, earned in [("new user", []), ("all sections already earned", list(QUEST_CONFIG))]:
+        for phase in ("cold", "warm"):
+            row = []
+            for load in (polling_load, single_pass_load):
+                users = CountingCollection([sample_user(earned)])
+                load(users)
+                if phase == "warm":
+                    users.reads = users.writes = 0
+                    load(users)
+                row.append(f"{users.reads}r/{users.writes}w")
+            print(f"{label + ', ' + phase:<36} {row[0]:>10} {row[1]:>12}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+"""Scale test: how route latency, response size and memory grow with data.
+
+For every (users, history months) pair this fills a Mongo stand-in with
+``benchmarks.data_generator``, drives the real Flask app through its test
+client and reports per-route median latency, response size and peak
+allocation, then fits log-log slopes against N and history length
+(~0 is flat, ~1 is linear).
+
+    python -m benchmarks.scale_test --users 100 1000 5000 --history-months 6 24 96
+
+The stand-in is an in-process mongomock database (``mongomock`` is in
+requirements.txt) unless --mongodb-uri
+points at a throwaway local mongod (its ``fincoach`` database is wiped).
+mongomock has no indexes, so its latency~N slopes include a linear scan
+per lookup; use a real mongod for index-realistic N curves.
+/playbook is not measured because it is dominated by the Gemini call.
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+
+from benchmarks.data_generator import PASSWORD, populate
+
+# (path, method, request kwargs, whether the route writes to the user).
+ROUTES = [
+    ("/home", "post", lambda email: {"json": {"email": email}}, False),
+    ("/login", "post", lambda email: {"json": {"email": email, "password": PASSWORD}}, False),
+    ("/api/user/profile", "get", lambda email: {"query_string": {"email": email}}, False),
+    ("/tracker/recent", "post", lambda email: {"json": {"email": email}}, False),
+    ("/tracker/update", "post", lambda email: {"json": {"email": email, "savings": 1000.0, "expenditure": 800.0}}, True),
+    ("/quests", "get", lambda email: {"query_string": {"email": email}}, False),
+    ("/quests/check", "post", lambda email: {"json": {"email": email}}, True),
+    ("/quests/leaderboard", "get", lambda email: {}, False),
+    ("/credit-score", "post", lambda email: {"json": {"email": email}}, True),
+]
+
+
+def prepare_environment(mongodb_uri):
+    """Point every route module at the stand-in database before importing the app."""
+    if mongodb_uri and mongodb_uri == os.getenv("MONGODB_URI"):
+        raise SystemExit("refusing to overwrite the database configured in MONGODB_URI")
+
+    import pymongo
+
+    if mongodb_uri:
+        shared_client = pymongo.MongoClient(mongodb_uri)
+    else:
+        import mongomock
+
+        shared_client = mongomock.MongoClient()
+    pymongo.MongoClient = lambda *args, **kwargs: shared_client
+
+    for key in ("FLASK_SECRET_KEY", "JWT_SECRET_KEY", "GEMINI_API_KEY"):
+        os.environ.setdefault(key, "scale-test-not-a-secret-0123456789")
+
+    model_dir = os.getenv("MODEL_DIR", ".")
+    if not os.path.exists(os.path.join(model_dir, "rf_model.pkl")):
+        import joblib
+
+        from benchmarks.batch_scoring_load_test import train_models
+
+        model_dir = tempfile.mkdtemp(prefix="fincoach-models-")
+        for model, name in zip(train_models(np.random.default_rng(0)), ("rf_model.pkl", "gb_model.pkl", "meta_model.pkl")):
+            joblib.dump(model, os.path.join(model_dir, name))
+        os.environ["MODEL_DIR"] = model_dir
+        print(f"No models in MODEL_DIR, using stand-in models in {model_dir}")
+
+    return shared_client.fincoach
+
+
+def measure_route(client, db, path, method, kwargs_fn, writes, emails, samples):
+    latencies, sizes, peaks = [], [], []
+    call = getattr(client, method)
+    for email in random.sample(emails, min(samples, len(emails))):
+        kwargs = kwargs_fn(email)
+        # Write routes grow the user's history; restore the original document
+        # after each call so both calls, and later grid points, see the
+        # generated history length.
+        original = db.users.find_one({"email": email}) if writes else None
+
+        start = time.perf_counter()
+        response = call(path, **kwargs)
+        latencies.append(time.perf_counter() - start)
+        sizes.append(len(response.get_data()))
+        if writes:
+            db.users.replace_one({"_id": original["_id"]}, original)
+
+        tracemalloc.start()
+        call(path, **kwargs)
+        peaks.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+        if writes:
+            db.users.replace_one({"_id": original["_id"]}, original)
+    return {
+        "latency_ms": float(np.median(latencies) * 1000),
+        "response_kb": float(np.mean(sizes) / 1024),
+        "peak_kb": float(np.median(peaks) / 1024),
+    }
+
+
+def document_kb(db):
+    import bson
+
+    docs = list(db.users.find({}, {"_id": 0}).limit(200))
+    return float(np.mean([len(bson.encode(d)) for d in docs]) / 1024) if docs else 0.0
+
+
+def slope(xs, ys):
+    if len(xs) < 2:
+        return float("nan")
+    return float(np.polyfit(np.log(xs), np.log(np.maximum(ys, 1e-6)), 1)[0])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, nargs="+", default=[100, 1000, 5000])
+    parser.add_argument("--history-months", type=int, nargs="+", default=[6, 24, 96])
+    parser.add_argument("--samples", type=int, default=20)
+    parser.add_argument("--mongodb-uri")
+    args = parser.parse_args()
+
+    db = prepare_environment(args.mongodb_uri)
+    from app import app
+
+    client = app.test_client()
+    results = {}
+    for users in args.users:
+        for months in args.history_months:
+            populate(db, users, months)
+            emails = [u["email"] for u in db.users.find({}, {"email": 1})]
+            print(f"\nN={users} history={months} months, avg user document {document_kb(db):.1f} KB")
+            print(f"  {'route':<20} {'median ms':>10} {'resp KB':>9} {'peak KB':>9}")
+            for path, method, kwargs_fn, writes in ROUTES:
+                stats = measure_route(client, db, path, method, kwargs_fn, writes, emails, args.samples)
+                results[(path, users, months)] = stats
+                print(f"  {path:<20} {stats['latency_ms']:>10.2f} {stats['response_kb']:>9.1f} {stats['peak_kb']:>9.1f}")
+
+    history_at, users_at = max(args.history_months), max(args.users)
+    print(f"\nGrowth exponents (log-log slope; vs N at history={history_at}, vs history at N={users_at})")
+    print(f"  {'route':<20} {'latency~N':>10} {'latency~H':>10} {'resp~H':>8} {'mem~H':>8}")
+    for path, _, _, _ in ROUTES:
+        by_n = [results[(path, n, history_at)] for n in args.users]
+        by_h = [results[(path, users_at, h)] for h in args.history_months]
+        print(f"  {path:<20} {slope(args.users, [r['latency_ms'] for r in by_n]):>10.2f}"
+              f" {slope(args.history_months, [r['latency_ms'] for r in by_h]):>10.2f}"
+              f" {slope(args.history_months, [r['response_kb'] for r in by_h]):>8.2f}"
+              f" {slope(args.history_months, [r['peak_kb'] for r in by_h]):>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
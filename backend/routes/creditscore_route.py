@@ -12,10 +12,10 @@ import pandas as pd
 import numpy as np
 import shap
 from datetime import timedelta
+from services.quest_engine import evaluate_quests
+from services.single_flight import make_key, single_flight
+from services.model_registry import model_registry
 
-rf = joblib.load("rf_model.pkl")
-gb = joblib.load("gb_model.pkl")
-meta_model = joblib.load("meta_model.pkl")
 client = MongoClient(os.getenv("MONGODB_URI"))  
 db = client.fincoach  
 users_collection = db.users  
@@ -51,32 +51,22 @@ def credit_score():
         "total_asset_value": sum(float(asset["value"]) for asset in sample_user["assets"]),
         "salary": float(sample_user["job"]["salary"])
     }])
-    
-    
-    pred_rf = rf.predict(df)[0]
-    pred_gb = gb.predict(df)[0]
-    
-    
-    stack_input = pd.DataFrame([{"rf": pred_rf, "gb": pred_gb}])
-    credit_score_pred = meta_model.predict(stack_input)[0]
+
+    key = make_key("credit-score", email, model_registry.current.version, df.iloc[0].to_dict())
+    response = single_flight.do(key, lambda: score_user(email, sample_user, df))
+    return jsonify(response)
+
+def score_user(email, sample_user, df):
+    model_version, (pred_rf, pred_gb, credit_score_pred, shap_row) = model_registry.score(df)
     credit_score_pred = int(round(credit_score_pred))
     
-    explainer_rf = shap.TreeExplainer(rf)
-    explainer_gb = shap.TreeExplainer(gb)
-    
-    shap_values_rf = explainer_rf.shap_values(df)
-    shap_values_gb = explainer_gb.shap_values(df)
-    
-    
-    shap_values_avg = (shap_values_rf + shap_values_gb) / 2
-    
     
-    shap_importance = np.abs(shap_values_avg).mean(axis=0)
+    shap_importance = np.abs(shap_row)
     shap_data = []
     for i, feature in enumerate(FEATURES):
         shap_data.append({
             "feature": feature,
-            "shap_value": int(round(shap_values_avg[0][i])),
+            "shap_value": int(round(shap_row[i])),
             "importance": int(round((shap_importance[i] / shap_importance.sum())))
         })
     
@@ -90,8 +80,9 @@ def credit_score():
 
     users_collection.update_one(
         {"email": email},
-        {"$push": {"credit_scores": {"score": credit_score_pred, "timestamp": pd.Timestamp.now().isoformat()}}}
+        {"$push": {"credit_scores": {"score": credit_score_pred, "timestamp": pd.Timestamp.now().isoformat(), "model_version": model_version}}}
     )
+    quest_awards = evaluate_quests(users_collection, email, quests_collection=quests_collection)
     if credit_score_pred < 650:
         score_range = "Poor"
     elif credit_score_pred < 700:
@@ -102,12 +93,13 @@ def credit_score():
         score_range = "Excellent"
 
     historical_trend = [
-        {"month": cs["timestamp"][:7], "score": cs["score"]}  
+        {"month": cs["timestamp"][:7], "score": cs["score"], "model_version": cs.get("model_version")}
         for cs in sample_user.get("credit_scores", [])
     ]
     response = {
         "predicted_score": float(credit_score_pred),
         "score_range": score_range,
+        "model_version": model_version,
         "confidence": confidence,
         "factors": {
             "positive": factors_positive,
@@ -115,6 +107,7 @@ def credit_score():
         },
         "shap_explanation": shap_data,
         "historical_trend": historical_trend,
+        "quest_awards": quest_awards or [],
         "score_breakdown": [
       {"category": "Payment History", "score": 95, "weight": 35},
         {"category": "Credit Utilization", "score": 78, "weight": 30},
@@ -137,4 +130,4 @@ def credit_score():
     ]
     }
 
-    return jsonify(response)
\ No newline at end of file
+    return response
\ No newline at end of file
@@ -0,0 +1,36 @@
+import hmac
+import os
+
+from flask import jsonify, request, Blueprint
+from services.model_registry import MODEL_DIR, model_registry, release_dir
+
+MODEL_ADMIN_TOKEN = os.getenv("MODEL_ADMIN_TOKEN")
+
+model_bp = Blueprint("model", __name__)
+
+@model_bp.route("/models", methods=["GET"])
+def get_model_status():
+    return jsonify(model_registry.status()), 200
+
+@model_bp.route("/models/reload", methods=["POST"])
+def reload_models():
+    if not MODEL_ADMIN_TOKEN:
+        return jsonify({"error": "Model reload is disabled (MODEL_ADMIN_TOKEN not set)"}), 403
+
+    token = request.headers.get("Authorization", "").removeprefix("Bearer ")
+    if not hmac.compare_digest(token.encode("utf-8"), MODEL_ADMIN_TOKEN.encode("utf-8")):
+        return jsonify({"error": "Unauthorized"}), 401
+
+    data = request.get_json(silent=True) or {}
+    release = data.get("release")
+    if release is None:
+        model_dir = MODEL_DIR
+    else:
+        model_dir = release_dir(release)
+        if model_dir is None:
+            return jsonify({"error": "Unknown model release"}), 400
+
+    if not model_registry.load_async(model_dir):
+        return jsonify({"error": "A model reload is already in progress"}), 409
+
+    return jsonify({"message": "Model reload started", "current_version": model_registry.current.version}), 202
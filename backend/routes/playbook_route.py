@@ -12,6 +12,8 @@ import pandas as pd
 import numpy as np
 import shap
 from datetime import timedelta
+from services.prompt_builder import build_playbook_prompt
+from services.single_flight import make_key, single_flight
 
 GEMINI_KEY = os.getenv('GEMINI_API_KEY')
 clientai = genai.Client(api_key=GEMINI_KEY)
@@ -50,40 +52,27 @@ def financial_playbook():
 
         
         user_query = data.get("query", "How can I retire in 15 years?")
-        prompt = f"""
-        You are a certified financial advisor helping clients create personalized financial plans.
-
-        Here’s the user’s financial profile:
-        - Monthly Salary: ₹{user_summary["salary"]}
-        - Total Savings: ₹{user_summary["savings"]}
-        - Monthly Expenditure: ₹{user_summary["expenditure"]}
-        - Loans: {user_summary["loans"]}
-        - Assets: {user_summary["assets"]}
-        - Investments: {user_summary["investments"]}
-        - Savings Accounts: {user_summary["savings_accounts"]}
-        - Current Accounts: {user_summary["current_accounts"]}
-
-        The user is asking: "{user_query}"
-
-        Please give a clear, actionable financial strategy — including saving targets, investment diversification,
-        and long-term planning steps specific to Indian markets (mutual funds, PPF, NPS, SIPs, etc.).
-        Format it nicely in bullet points. Help the user in Investment strategies tailored to your income
-        Savings optimization techniques , 
-        Debt management and loan planning,
-        Financial goal setting and tracking and 
-        Market insights and recommendations
-        """
+        prompt, estimated_tokens = build_playbook_prompt(user_summary, user_query)
 
         
-        response = clientai.models.generate_content(
-            model='gemini-2.5-flash',
-            contents=[prompt],
-        )
+        key = make_key("playbook", email, prompt)
+        advice, prompt_tokens = single_flight.do(key, lambda: generate_advice(prompt, estimated_tokens))
         return jsonify({
-            "advice": response.text.strip(),
-            "user_summary": user_summary
+            "advice": advice,
+            "user_summary": user_summary,
+            "prompt_tokens": prompt_tokens,
+            "estimated_prompt_tokens": estimated_tokens
         }), 200
 
     except Exception as e:
         print("Error:", e)
-        return jsonify({"error": str(e)}), 500
\ No newline at end of file
+        return jsonify({"error": str(e)}), 500
+
+def generate_advice(prompt, estimated_tokens):
+    response = clientai.models.generate_content(
+        model='gemini-2.5-flash',
+        contents=[prompt],
+    )
+    usage = getattr(response, "usage_metadata", None)
+    prompt_tokens = getattr(usage, "prompt_token_count", None) or estimated_tokens
+    return [response.text.strip(), prompt_tokens]
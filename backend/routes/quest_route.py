@@ -12,6 +12,7 @@ import pandas as pd
 import numpy as np
 import shap
 from datetime import timedelta
+from services.quest_engine import QUEST_CONFIG, evaluate_quests
 
 quest_bp = Blueprint("quest", __name__)
 client = MongoClient(os.getenv("MONGODB_URI"))  
@@ -125,71 +126,35 @@ def get_leaderboard():
     
     return jsonify({"leaderboard": leaderboard}), 200
 
+@quest_bp.route("/quests/check", methods=["POST"])
+def check_all_quests():
+    user_email = request.json.get("email")
+    if not user_email:
+        return jsonify({"error": "Email required"}), 400
+
+    awards = evaluate_quests(users_collection, user_email, quests_collection=quests_collection)
+    if awards is None:
+        return jsonify({"error": "User not found"}), 404
+
+    return jsonify({
+        "awards": awards,
+        "points_awarded": sum(a["points_awarded"] for a in awards)
+    }), 200
+
 @quest_bp.route("/quests/check/<section>", methods=["POST"])
 def check_quest_section(section):
     user_email = request.json.get("email")
     if not user_email:
         return jsonify({"error": "Email required"}), 400
 
-    user = users_collection.find_one({"email": user_email})
-    if not user:
-        return jsonify({"error": "User not found"}), 404
-    quests = user.get("quests", {})
-    if isinstance(quests, str):
-        import json
-        quests = json.loads(quests)  
-
-    badges = quests.get("badges", [])
-    if not isinstance(badges, list):
-        badges = []
-    
-    QUEST_CONFIG = {
-        "accounts": {"points": 100, "badge_name": "Multi-Account Holder", "description": "You earned 100 points for having multiple accounts", "icon": "Building2"},
-        "investments": {"points": 150, "badge_name": "Investment Starter", "description": "You earned 150 points for your first investment", "icon": "TrendingUp"},
-        "assets": {"points": 200, "badge_name": "Asset Builder", "description": "You earned 200 points for recording assets", "icon": "Building2"},
-        "savings": {"points": 120, "badge_name": "Savings Growth", "description": "You earned 120 points for saving more than last month", "icon": "PiggyBank"},
-        "credit": {"points": 100, "badge_name": "Credit Score Explorer", "description": "You checked your credit score", "icon": "CreditCard"},
-        "tracking": {"points": 80, "badge_name": "Tracking Enthusiast", "description": "You tracked your expenses for a month", "icon": "Activity"},
-    }
-
-    quest_cfg = QUEST_CONFIG.get(section)
-    if not quest_cfg:
+    if section not in QUEST_CONFIG:
         return jsonify({"error": "Invalid quest section"}), 400
 
-    completed = False
+    awards = evaluate_quests(users_collection, user_email, sections=[section])
+    if awards is None:
+        return jsonify({"error": "User not found"}), 404
 
-    
-    if section == "accounts":
-        completed = len(user.get("savings_accounts", [])) > 1 or len(user.get("current_accounts", [])) > 1
-    elif section == "investments":
-        completed = len(user.get("investments", [])) > 0
-    elif section == "assets":
-        completed = len(user.get("assets", [])) > 0
-    elif section == "savings":
-        savings = user.get("savings", [])
-        if len(savings) >= 2 and savings[-1] > savings[-2]:
-            completed = True
-    elif section == "credit":
-        completed = len(user.get("credit_scores", [])) > 0
-    elif section == "tracking":
-        completed = user.get("tracking_count", 0) >= 3
+    if awards:
+        return jsonify({"message": f"Quest '{section}' completed!", "points_awarded": awards[0]["points_awarded"], "badge": awards[0]["badge"]}), 200
 
-    
-    if completed:
-        existing_badge = next((b for b in user.get("quests", {}).get("badges", []) if b["name"] == quest_cfg["badge_name"]), None)
-        if not existing_badge:
-            badge = {
-                "name": quest_cfg["badge_name"],
-                "description": quest_cfg["description"],
-                "icon": quest_cfg["icon"],
-                "earned_date": datetime.now().isoformat()
-            }
-            
-            user.setdefault("quests", {}).setdefault("badges", []).append(badge)
-            user["quests"]["points"] = user.get("quests", {}).get("points", 0) + quest_cfg["points"]
-
-            users_collection.update_one({"email": user_email}, {"$set": user})
-
-            return jsonify({"message": f"Quest '{section}' completed!", "points_awarded": quest_cfg["points"], "badge": badge}), 200
-
-    return jsonify({"message": f"Quest '{section}' not completed or already earned", "points_awarded": 0}), 200
\ No newline at end of file
+    return jsonify({"message": f"Quest '{section}' not completed or already earned", "points_awarded": 0}), 200
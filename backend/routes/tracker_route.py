@@ -12,6 +12,7 @@ import pandas as pd
 import numpy as np
 import shap
 from datetime import timedelta
+from services.quest_engine import evaluate_quests
 
 tracker_bp = Blueprint("tracker", __name__)
 client = MongoClient(os.getenv("MONGODB_URI"))  
@@ -56,10 +57,12 @@ def update_tracker():
         {"email": email},
         {"savings": 1, "expenditure": 1, "_id": 0}
     )
+    quest_awards = evaluate_quests(users_collection, email, quests_collection=quests_collection)
 
     return jsonify({
         "message": "Tracker updated successfully",
-        "updated_data": updated_user
+        "updated_data": updated_user,
+        "quest_awards": quest_awards or []
     }), 200
 
 @tracker_bp.route("/tracker/recent", methods=["POST"])
@@ -12,6 +12,7 @@ import pandas as pd
 import numpy as np
 import shap
 from datetime import timedelta
+from services.quest_engine import evaluate_quests
 
 update_bp = Blueprint("update", __name__)
 client = MongoClient(os.getenv("MONGODB_URI"))  
@@ -74,11 +75,13 @@ def update_user_section():
             return jsonify({"message": "No changes made or user not found"}), 200
 
         
+        quest_awards = evaluate_quests(users_collection, email, quests_collection=quests_collection)
         updated_user = users_collection.find_one({"email": email}, {"_id": 0, "password_hash": 0})
 
         return jsonify({
             "message": f"{section.capitalize()} updated successfully",
-            "updated_user": updated_user
+            "updated_user": updated_user,
+            "quest_awards": quest_awards or []
         }), 200
 
     except Exception as e:
@@ -0,0 +1,152 @@
+import json
+import os
+import threading
+import time
+
+from flask import g, jsonify, request
+
+from services.batch_scorer import CREDIT_BATCH_MAX_SIZE
+
+# Each limiter caps concurrent requests, how many may wait for a slot, and
+# how long they may wait. "heavy" is a shared pool across the expensive
+# endpoints that do their work per request, so that together they can never
+# take every worker. Concurrent /credit-score requests share one model pass
+# in the batch scorer, so that endpoint is limited on its own, to a full
+# batch in flight plus one queued.
+DEFAULT_LIMITS = {
+    "heavy": {"concurrency": 6, "queue": 6, "timeout": 2.0},
+    "credit-score": {"concurrency": CREDIT_BATCH_MAX_SIZE, "queue": CREDIT_BATCH_MAX_SIZE, "timeout": 2.0},
+    "playbook": {"concurrency": 2, "queue": 4, "timeout": 5.0},
+    "signup": {"concurrency": 4, "queue": 8, "timeout": 1.0},
+}
+
+# Priority classes: request endpoint -> limiters it must pass, in order.
+# Endpoints not listed (e.g. /home, /tracker/recent) are lightweight reads
+# and are always admitted.
+DEFAULT_ROUTES = {
+    "credit.credit_score": ["credit-score"],
+    "playbook.financial_playbook": ["playbook", "heavy"],
+    "auth.signup": ["signup", "heavy"],
+}
+
+RETRY_AFTER_SECONDS = int(os.getenv("ADMISSION_RETRY_AFTER", "1"))
+
+
+class Rejected(Exception):
+    def __init__(self, limiter, status, reason):
+        super().__init__(reason)
+        self.limiter = limiter
+        self.status = status
+        self.reason = reason
+
+
+class Limiter:
+    def __init__(self, name, concurrency, queue, timeout):
+        self.name = name
+        self.concurrency = concurrency
+        self.queue = queue
+        self.timeout = timeout
+        self.active = 0
+        self.waiting = 0
+        self.admitted = 0
+        self.rejected_queue_full = 0
+        self.rejected_timeout = 0
+        self._cond = threading.Condition()
+
+    def acquire(self):
+        with self._cond:
+            if self.active < self.concurrency and self.waiting == 0:
+                self.active += 1
+                self.admitted += 1
+                return
+            if self.waiting >= self.queue:
+                self.rejected_queue_full += 1
+                raise Rejected(self.name, 429, "queue full")
+
+            self.waiting += 1
+            deadline = time.monotonic() + self.timeout
+            try:
+                while self.active >= self.concurrency:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self.rejected_timeout += 1
+                        # Pass on any wake-up this waiter may have consumed.
+                        self._cond.notify()
+                        raise Rejected(self.name, 503, "timed out waiting for capacity")
+                    self._cond.wait(remaining)
+            finally:
+                self.waiting -= 1
+            self.active += 1
+            self.admitted += 1
+
+    def release(self):
+        with self._cond:
+            self.active -= 1
+            self._cond.notify()
+
+    def stats(self):
+        with self._cond:
+            return {
+                "concurrency": self.concurrency,
+                "queue": self.queue,
+                "timeout": self.timeout,
+                "active": self.active,
+                "waiting": self.waiting,
+                "admitted": self.admitted,
+                "rejected_queue_full": self.rejected_queue_full,
+                "rejected_timeout": self.rejected_timeout,
+            }
+
+
+class AdmissionController:
+    """Per-endpoint concurrency limits with bounded queues and fast rejection.
+
+    Limits default to DEFAULT_LIMITS and can be overridden per limiter with
+    the ADMISSION_LIMITS environment variable (JSON, same shape).
+    """
+
+    def __init__(self, limits=None, routes=None):
+        limits = dict(limits or DEFAULT_LIMITS)
+        for name, override in json.loads(os.getenv("ADMISSION_LIMITS", "{}")).items():
+            limits[name] = {**limits.get(name, {}), **override}
+        self.limiters = {name: Limiter(name, **cfg) for name, cfg in limits.items()}
+        self.routes = routes or DEFAULT_ROUTES
+
+    def admit(self, endpoint):
+        acquired = []
+        try:
+            for name in self.routes.get(endpoint, []):
+                self.limiters[name].acquire()
+                acquired.append(name)
+        except Rejected:
+            self.release(acquired)
+            raise
+        return acquired
+
+    def release(self, acquired):
+        for name in reversed(acquired):
+            self.limiters[name].release()
+
+    def stats(self):
+        return {name: limiter.stats() for name, limiter in self.limiters.items()}
+
+    def init_app(self, app):
+        @app.before_request
+        def _admit():
+            if request.method == "OPTIONS":
+                return None
+            try:
+                g.admission = self.admit(request.endpoint)
+            except Rejected as e:
+                g.admission = []
+                response = jsonify({"error": f"Server busy ({e.limiter}: {e.reason}), please retry"})
+                response.status_code = e.status
+                response.headers["Retry-After"] = str(RETRY_AFTER_SECONDS)
+                return response
+
+        @app.teardown_request
+        def _release(exc):
+            self.release(g.pop("admission", []))
+
+
+admission = AdmissionController()
@@ -0,0 +1,109 @@
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+import pandas as pd
+import shap
+
+CREDIT_BATCH_MAX_WAIT_MS = float(os.getenv("CREDIT_BATCH_MAX_WAIT_MS", "5"))
+CREDIT_BATCH_MAX_SIZE = int(os.getenv("CREDIT_BATCH_MAX_SIZE", "64"))
+
+
+class ScorerClosed(RuntimeError):
+    pass
+
+
+class BatchScorer:
+    """Micro-batch concurrent credit-score requests into one model pass.
+
+    ``score`` enqueues a single-row feature frame and blocks until a worker
+    thread has scored it together with whatever else arrived within
+    ``max_wait_ms`` (up to ``max_batch_size`` rows): one predict per model
+    and one SHAP call per explainer for the whole batch.
+    """
+
+    def __init__(self, rf, gb, meta_model, max_wait_ms=CREDIT_BATCH_MAX_WAIT_MS, max_batch_size=CREDIT_BATCH_MAX_SIZE):
+        self.rf = rf
+        self.gb = gb
+        self.meta_model = meta_model
+        self.explainer_rf = shap.TreeExplainer(rf)
+        self.explainer_gb = shap.TreeExplainer(gb)
+        self.max_wait = max_wait_ms / 1000
+        self.max_batch_size = max_batch_size
+        self.batches = 0
+        self.rows = 0
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._closed = False
+        self._worker = threading.Thread(target=self._run, daemon=True)
+        self._worker.start()
+
+    def predict_batch(self, batch):
+        pred_rf = self.rf.predict(batch)
+        pred_gb = self.gb.predict(batch)
+        stack_input = pd.DataFrame({"rf": pred_rf, "gb": pred_gb})
+        scores = self.meta_model.predict(stack_input)
+        shap_values_avg = (self.explainer_rf.shap_values(batch) + self.explainer_gb.shap_values(batch)) / 2
+        return pred_rf, pred_gb, scores, shap_values_avg
+
+    def score(self, df):
+        """Return ``(pred_rf, pred_gb, score, shap_row)`` for a one-row frame."""
+        future = Future()
+        with self._lock:
+            if self._closed:
+                raise ScorerClosed("scorer has been replaced")
+            self._queue.put((df, future))
+        return future.result()
+
+    def close(self):
+        """Stop the worker once every request queued so far has been scored."""
+        with self._lock:
+            self._closed = True
+            self._queue.put(None)
+
+    def _run(self):
+        closing = False
+        while not closing:
+            item = self._queue.get()
+            if item is None:
+                return
+            items = [item]
+            deadline = time.monotonic() + self.max_wait
+            while len(items) < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is None:
+                    closing = True
+                    break
+                items.append(item)
+            self._score_items(items)
+
+    def _score_items(self, items):
+        try:
+            batch = pd.concat([df for df, _ in items], ignore_index=True)
+            pred_rf, pred_gb, scores, shap_values_avg = self.predict_batch(batch)
+        except Exception as e:
+            for _, future in items:
+                future.set_exception(e)
+            return
+
+        self.batches += 1
+        self.rows += len(items)
+        for i, (_, future) in enumerate(items):
+            future.set_result((pred_rf[i], pred_gb[i], scores[i], shap_values_avg[i]))
+
+    def stats(self):
+        return {
+            "batches": self.batches,
+            "rows": self.rows,
+            "avg_batch_size": round(self.rows / self.batches, 2) if self.batches else 0,
+            "max_wait_ms": self.max_wait * 1000,
+            "max_batch_size": self.max_batch_size,
+        }
@@ -0,0 +1,125 @@
+import hashlib
+import io
+import os
+import threading
+from datetime import datetime
+
+import joblib
+import pandas as pd
+
+from services.batch_scorer import BatchScorer, ScorerClosed
+
+MODEL_DIR = os.getenv("MODEL_DIR", ".")
+# Optional directory of named model releases (one subdirectory each) that
+# /models/reload may switch to. Unset means reloads only re-read MODEL_DIR.
+MODEL_ROOT = os.getenv("MODEL_ROOT")
+MODEL_FILES = ("rf_model.pkl", "gb_model.pkl", "meta_model.pkl")
+
+
+def read_model_files(model_dir):
+    """Return ``(version, blobs)``; the version is a hash of the exact bytes loaded."""
+    digest = hashlib.sha256()
+    blobs = []
+    for name in MODEL_FILES:
+        with open(os.path.join(model_dir, name), "rb") as f:
+            blob = f.read()
+        digest.update(blob)
+        blobs.append(blob)
+    return digest.hexdigest()[:12], blobs
+
+
+def release_dir(release):
+    """Resolve a release name to a subdirectory of MODEL_ROOT, or None if not allowed."""
+    if not MODEL_ROOT or not release or release in (".", "..") or os.sep in release or (os.altsep and os.altsep in release):
+        return None
+    root = os.path.realpath(MODEL_ROOT)
+    path = os.path.realpath(os.path.join(root, release))
+    if os.path.dirname(path) != root or not os.path.isdir(path):
+        return None
+    return path
+
+
+class ModelSet:
+    def __init__(self, version, model_dir, rf, gb, meta_model):
+        self.version = version
+        self.model_dir = model_dir
+        self.loaded_at = datetime.now().isoformat()
+        # Building the scorer builds both SHAP explainers.
+        self.scorer = BatchScorer(rf, gb, meta_model)
+
+    def warm_up(self):
+        columns = getattr(self.scorer.rf, "feature_names_in_", None)
+        if columns is not None:
+            self.scorer.predict_batch(pd.DataFrame([[0.0] * len(columns)], columns=columns))
+
+
+class ModelRegistry:
+    """Hold the live credit model set and hot-swap it without a restart.
+
+    ``load`` builds and warms a new set before swapping it in, so requests
+    keep using the old set until the new one is ready. Requests already
+    queued on the old scorer still complete on it.
+    """
+
+    def __init__(self, model_dir=MODEL_DIR):
+        self._lock = threading.Lock()
+        self.current = None
+        self.loading = None
+        self.last_error = None
+        self.load(model_dir)
+
+    def load(self, model_dir):
+        version, blobs = read_model_files(model_dir)
+        rf, gb, meta_model = (joblib.load(io.BytesIO(blob)) for blob in blobs)
+        model_set = ModelSet(version, model_dir, rf, gb, meta_model)
+        model_set.warm_up()
+
+        with self._lock:
+            previous, self.current = self.current, model_set
+        if previous is not None:
+            previous.scorer.close()
+        return model_set
+
+    def load_async(self, model_dir):
+        with self._lock:
+            if self.loading:
+                return False
+            self.loading = model_dir
+
+        def run():
+            try:
+                self.load(model_dir)
+                self.last_error = None
+            except Exception as e:
+                print("Error loading models:", e)
+                self.last_error = str(e)
+            finally:
+                with self._lock:
+                    self.loading = None
+
+        threading.Thread(target=run, daemon=True).start()
+        return True
+
+    def score(self, df):
+        """Score one row on the live set; return ``(version, result)``."""
+        while True:
+            model_set = self.current
+            try:
+                return model_set.version, model_set.scorer.score(df)
+            except ScorerClosed:
+                continue
+
+    def status(self):
+        # Served without auth, so no filesystem paths or raw error text; the
+        # error itself is printed when the reload fails.
+        model_set = self.current
+        return {
+            "version": model_set.version,
+            "loaded_at": model_set.loaded_at,
+            "loading": self.loading is not None,
+            "last_reload_failed": self.last_error is not None,
+            "batching": model_set.scorer.stats(),
+        }
+
+
+model_registry = ModelRegistry()
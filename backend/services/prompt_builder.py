@@ -0,0 +1,97 @@
+import os
+
+PROMPT_TOKEN_BUDGET = int(os.getenv("PLAYBOOK_PROMPT_TOKEN_BUDGET", "600"))
+PROMPT_TOP_K = int(os.getenv("PLAYBOOK_PROMPT_TOP_K", "3"))
+
+# Rough chars-per-token ratio for Gemini on mixed English/number text.
+CHARS_PER_TOKEN = 4
+
+PROMPT_HEADER = """
+You are a certified financial advisor helping clients create personalized financial plans.
+
+Here’s the user’s financial profile:
+"""
+
+PROMPT_FOOTER = """
+The user is asking: "{user_query}"
+
+Please give a clear, actionable financial strategy — including saving targets, investment diversification,
+and long-term planning steps specific to Indian markets (mutual funds, PPF, NPS, SIPs, etc.).
+Format it nicely in bullet points. Help the user in Investment strategies tailored to your income
+Savings optimization techniques ,
+Debt management and loan planning,
+Financial goal setting and tracking and
+Market insights and recommendations
+"""
+
+
+def estimate_tokens(text):
+    return max(1, (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN)
+
+
+def _to_float(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _label(item):
+    for key in ("bank_name", "stock", "type", "name"):
+        if item.get(key):
+            return str(item[key])
+    return "item"
+
+
+def summarize_holdings(items, value_key, top_k):
+    items = [i for i in items or [] if isinstance(i, dict)]
+    if not items:
+        return "none"
+    total = sum(_to_float(i.get(value_key)) for i in items)
+    line = f"{len(items)} totalling ₹{total:,.0f}"
+    if top_k > 0:
+        top = sorted(items, key=lambda i: _to_float(i.get(value_key)), reverse=True)[:top_k]
+        line += " (top: " + ", ".join(f"{_label(i)} ₹{_to_float(i.get(value_key)):,.0f}" for i in top) + ")"
+    return line
+
+
+def summarize_loans(loans, salary, top_k):
+    loans = [l for l in loans or [] if isinstance(l, dict)]
+    total_emi = sum(_to_float(l.get("emi")) for l in loans)
+    if not loans:
+        return "none"
+    line = summarize_holdings(loans, "amount", top_k)
+    line += f"; total EMI ₹{total_emi:,.0f}/month"
+    salary = _to_float(salary)
+    if salary > 0:
+        line += f" ({total_emi / salary:.0%} of salary)"
+    return line
+
+
+def _profile_lines(user_summary, top_k):
+    return [
+        f"- Monthly Salary: ₹{user_summary['salary']}",
+        f"- Total Savings: ₹{user_summary['savings']}",
+        f"- Monthly Expenditure: ₹{user_summary['expenditure']}",
+        f"- Loans: {summarize_loans(user_summary['loans'], user_summary['salary'], top_k)}",
+        f"- Assets: {summarize_holdings(user_summary['assets'], 'value', top_k)}",
+        f"- Investments: {summarize_holdings(user_summary['investments'], 'value', top_k)}",
+        f"- Savings Accounts: {summarize_holdings(user_summary['savings_accounts'], 'balance', top_k)}",
+        f"- Current Accounts: {summarize_holdings(user_summary['current_accounts'], 'balance', top_k)}",
+    ]
+
+
+def build_playbook_prompt(user_summary, user_query, token_budget=PROMPT_TOKEN_BUDGET, top_k=PROMPT_TOP_K):
+    """Render the playbook prompt with holdings compacted into aggregates.
+
+    The top-k breakdown is shrunk until the prompt fits ``token_budget``;
+    counts, totals and EMI burden are always kept. Returns the prompt and
+    its estimated token count.
+    """
+    footer = PROMPT_FOOTER.format(user_query=user_query)
+    for k in range(max(top_k, 0), -1, -1):
+        prompt = PROMPT_HEADER + "\n".join(_profile_lines(user_summary, k)) + "\n" + footer
+        tokens = estimate_tokens(prompt)
+        if tokens <= token_budget:
+            break
+    return prompt, tokens
@@ -0,0 +1,148 @@
+import json
+import time
+from datetime import datetime
+
+QUEST_CONFIG = {
+    "accounts": {"points": 100, "badge_name": "Multi-Account Holder", "description": "You earned 100 points for having multiple accounts", "icon": "Building2"},
+    "investments": {"points": 150, "badge_name": "Investment Starter", "description": "You earned 150 points for your first investment", "icon": "TrendingUp"},
+    "assets": {"points": 200, "badge_name": "Asset Builder", "description": "You earned 200 points for recording assets", "icon": "Building2"},
+    "savings": {"points": 120, "badge_name": "Savings Growth", "description": "You earned 120 points for saving more than last month", "icon": "PiggyBank"},
+    "credit": {"points": 100, "badge_name": "Credit Score Explorer", "description": "You checked your credit score", "icon": "CreditCard"},
+    "tracking": {"points": 80, "badge_name": "Tracking Enthusiast", "description": "You tracked your expenses for a month", "icon": "Activity"},
+}
+
+# Only what the rules below look at: list lengths are capped with $slice so
+# long histories never leave the database.
+QUEST_PROJECTION = {
+    "_id": 0,
+    "quests": 1,
+    "quest_progress": 1,
+    "tracking_count": 1,
+    "savings_accounts": {"$slice": 2},
+    "current_accounts": {"$slice": 2},
+    "investments": {"$slice": 1},
+    "assets": {"$slice": 1},
+    "savings": {"$slice": -2},
+    "credit_scores": {"$slice": -1},
+}
+
+SECTION_RULES = {
+    "accounts": lambda u: len(u.get("savings_accounts", [])) > 1 or len(u.get("current_accounts", [])) > 1,
+    "investments": lambda u: len(u.get("investments", [])) > 0,
+    "assets": lambda u: len(u.get("assets", [])) > 0,
+    "savings": lambda u: len(u.get("savings", [])) >= 2 and u["savings"][-1] > u["savings"][-2],
+    "credit": lambda u: len(u.get("credit_scores", [])) > 0,
+    "tracking": lambda u: u.get("tracking_count", 0) >= 3,
+}
+
+CATALOGUE_TTL_SECONDS = 300
+_catalogue_cache = {"loaded_at": None, "quests": {}}
+
+
+def load_catalogue(quests_collection):
+    now = time.monotonic()
+    loaded_at = _catalogue_cache["loaded_at"]
+    if loaded_at is None or now - loaded_at > CATALOGUE_TTL_SECONDS:
+        _catalogue_cache["quests"] = {q["id"]: q for q in quests_collection.find({}, {"_id": 0})}
+        _catalogue_cache["loaded_at"] = now
+    return _catalogue_cache["quests"]
+
+
+def _as_number(value):
+    if isinstance(value, (int, float)):
+        return value
+    try:
+        return float(value) if "." in str(value) else int(value)
+    except (TypeError, ValueError):
+        return 0
+
+
+def _make_badge(name, description, icon, earned_date):
+    return {"name": name, "description": description, "icon": icon, "earned_date": earned_date}
+
+
+def evaluate_quests(users_collection, email, sections=None, quests_collection=None):
+    """Evaluate quests for ``email`` with one projected read and at most one write.
+
+    ``sections`` limits which QUEST_CONFIG sections are checked (all by
+    default). Catalogue quests are only checked when ``quests_collection``
+    is given. Returns the list of awards made, or None if the user does
+    not exist.
+    """
+    user = users_collection.find_one({"email": email}, QUEST_PROJECTION)
+    if user is None:
+        return None
+
+    stored = user.get("quests")
+    quests = stored
+    if isinstance(quests, str):
+        try:
+            quests = json.loads(quests)
+        except ValueError:
+            quests = {}
+    if not isinstance(quests, dict):
+        quests = {}
+    badges = quests.get("badges", [])
+    if not isinstance(badges, list):
+        badges = []
+    # Stored as a string (JSON or not), null, missing, or with non-list
+    # badges or non-numeric points: dotted $push/$inc cannot apply to it, so
+    # the whole object is rewritten with $set instead.
+    replace_quests = (
+        not isinstance(stored, dict)
+        or not isinstance(stored.get("badges", []), list)
+        or not isinstance(stored.get("points", 0), (int, float))
+    )
+    earned = {b.get("name") for b in badges if isinstance(b, dict)}
+
+    now = datetime.now().isoformat()
+    awards = []
+    progress_updates = {}
+
+    for section in sections or QUEST_CONFIG:
+        cfg = QUEST_CONFIG[section]
+        if cfg["badge_name"] in earned or not SECTION_RULES[section](user):
+            continue
+        badge = _make_badge(cfg["badge_name"], cfg["description"], cfg["icon"], now)
+        awards.append({"section": section, "points_awarded": cfg["points"], "badge": badge})
+        earned.add(badge["name"])
+
+    if quests_collection is not None:
+        catalogue = load_catalogue(quests_collection)
+        for idx, entry in enumerate(user.get("quest_progress", [])):
+            quest = catalogue.get(entry.get("quest_id"))
+            if not quest or entry.get("completed") or entry.get("progress", 0) < quest["max_progress"]:
+                continue
+            progress_updates[f"quest_progress.{idx}.completed"] = True
+            progress_updates[f"quest_progress.{idx}.completed_date"] = now
+            if quest["title"] in earned:
+                continue
+            badge = _make_badge(quest["title"], quest["description"], quest["icon"], now)
+            awards.append({"section": "catalogue", "quest_id": quest["id"], "points_awarded": quest["points"], "badge": badge})
+            earned.add(badge["name"])
+
+    if not awards and not progress_updates:
+        return []
+
+    new_badges = [a["badge"] for a in awards]
+    points = sum(a["points_awarded"] for a in awards)
+
+    if replace_quests:
+        quests["badges"] = badges + new_badges
+        quests["points"] = _as_number(quests.get("points", 0)) + points
+        update = {"$set": {"quests": quests, **progress_updates}}
+    else:
+        update = {"$set": progress_updates} if progress_updates else {}
+        if new_badges:
+            update["$push"] = {"quests.badges": {"$each": new_badges}}
+            update["$inc"] = {"quests.points": points}
+
+    # The $nin guard makes a concurrent evaluation that already awarded one
+    # of these badges turn this write into a no-op instead of a double award.
+    result = users_collection.update_one(
+        {"email": email, "quests.badges.name": {"$nin": [b["name"] for b in new_badges]}},
+        update,
+    )
+    if result.matched_count == 0:
+        return []
+    return awards
@@ -0,0 +1,138 @@
+import hashlib
+import json
+import os
+import threading
+import time
+
+SINGLE_FLIGHT_LOCK_DIR = os.getenv("SINGLE_FLIGHT_LOCK_DIR")
+SINGLE_FLIGHT_RESULT_TTL = float(os.getenv("SINGLE_FLIGHT_RESULT_TTL", "2"))
+
+
+def make_key(endpoint, email, *inputs):
+    fingerprint = hashlib.sha256(json.dumps(inputs, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+    return f"{endpoint}:{email}:{fingerprint}"
+
+
+class _Call:
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """Coalesce concurrent calls that share a key into one execution.
+
+    Within a process, duplicates wait for the in-flight call and get its
+    result (or exception). When ``lock_dir`` is set, the leader also takes a
+    file lock per key so other workers queue behind it and reuse its result
+    for ``result_ttl`` seconds. That reuse also covers non-concurrent repeats
+    within the TTL, so side effects inside ``fn`` (such as the credit_scores
+    push) do not run for them. Expired result and lock files are removed
+    whenever a new result is written. Results are shared, so callers must
+    not mutate them.
+    """
+
+    def __init__(self, lock_dir=None, result_ttl=SINGLE_FLIGHT_RESULT_TTL):
+        self.lock_dir = lock_dir
+        self.result_ttl = result_ttl
+        self._lock = threading.Lock()
+        self._calls = {}
+        self.executions = 0
+        self.coalesced = 0
+        if lock_dir:
+            os.makedirs(lock_dir, exist_ok=True)
+
+    def do(self, key, fn):
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = self._run(key, fn)
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+        return call.result
+
+    def _execute(self, fn):
+        result = fn()
+        with self._lock:
+            self.executions += 1
+        return result
+
+    def _run(self, key, fn):
+        if not self.lock_dir:
+            return self._execute(fn)
+
+        from filelock import FileLock
+
+        path = os.path.join(self.lock_dir, hashlib.sha256(key.encode("utf-8")).hexdigest())
+        with FileLock(path + ".lock"):
+            try:
+                if time.time() - os.path.getmtime(path + ".json") <= self.result_ttl:
+                    with open(path + ".json", encoding="utf-8") as f:
+                        result = json.load(f)
+                    with self._lock:
+                        self.coalesced += 1
+                    return result
+            except (OSError, ValueError):
+                pass
+
+            result = self._execute(fn)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(result, f, default=str)
+            os.replace(tmp_path, path + ".json")
+
+        self._sweep()
+        return result
+
+    def _sweep(self):
+        """Remove result and lock files older than the TTL.
+
+        Results can hold user data, so they do not outlive the TTL on disk.
+        A lock file is only removed while this process holds it; a worker
+        that opened it just before the removal may run ``fn`` once more
+        instead of reusing a result.
+        """
+        from filelock import FileLock, Timeout
+
+        cutoff = time.time() - self.result_ttl
+        for entry in os.scandir(self.lock_dir):
+            try:
+                if entry.stat().st_mtime > cutoff:
+                    continue
+                if entry.name.endswith(".lock"):
+                    with FileLock(entry.path, timeout=0):
+                        os.remove(entry.path)
+                elif entry.name.endswith((".json", ".tmp")):
+                    os.remove(entry.path)
+            except (OSError, Timeout):
+                pass
+
+    def stats(self):
+        with self._lock:
+            return {
+                "executions": self.executions,
+                "coalesced": self.coalesced,
+                "in_flight": len(self._calls),
+                "shared_across_workers": bool(self.lock_dir),
+            }
+
+
+single_flight = SingleFlight(lock_dir=SINGLE_FLIGHT_LOCK_DIR)
@@ -50,6 +50,12 @@ interface JobDetails {
   salary: number;
 }
 
+interface QuestAward {
+  section: string;
+  points_awarded: number;
+  badge: { name: string; description: string; icon: string; earned_date: string };
+}
+
 interface UserData {
   savings_accounts: Account[];
   current_accounts: Account[];
@@ -169,7 +175,7 @@ const removeArrayItem = <T extends ArrayKeys>(arrayName: T, index: number) => {
       if (response.ok) {
         toast.success(`${tabName} updated successfully!`);
         setUserData(result.updated_user); //  refresh local data
-        checkQuestUpdates(tabName);
+        showQuestAwards(result.quest_awards);
       } else {
         toast.error(result.error || `Failed to update ${tabName}`);
       }
@@ -180,28 +186,13 @@ const removeArrayItem = <T extends ArrayKeys>(arrayName: T, index: number) => {
     }
   };
 
-  const checkQuestUpdates = async (section: string) => {
-  if (!user?.email) return;
-
-  try {
-    const res = await fetch(`http://localhost:5000/quests/check/${section}`, {
-      method: "POST",
-      headers: { "Content-Type": "application/json" },
-      body: JSON.stringify({ email: user.email }),
-    });
-    const data = await res.json();
-
-    if (data.points_awarded > 0) {
-      toast.success(`🏆 ${data.badge.name}!`, {
-        description: data.badge.description
+  const showQuestAwards = (awards: QuestAward[] = []) => {
+    awards.forEach((award) => {
+      toast.success(`🏆 ${award.badge.name}!`, {
+        description: award.badge.description
       });
-      fetchUserData(); // Refresh quests and leaderboard
-    }
-  } catch (err) {
-    console.error(err);
-    toast.error("Failed to check quest updates");
-  }
-};
+    });
+  };
 
 
   if (!userData) {